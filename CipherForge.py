@@ -4,6 +4,7 @@
 import random, string, os, sys, time, math
 from colorama import init, Fore, Style
 import pyperclip
+from markov import load_model, TARGET_BITS
 
 # Initialize colorama
 init(autoreset=True)
@@ -48,8 +49,28 @@ def generate_password(length=12, strength='medium'):
     session_passwords.append(password)
     return password
 
-def check_strength(password):
-    """Entropy-based password strength checker"""
+def generate_pronounceable(words=None):
+    """Markov-model words joined by digits, easy to read aloud; returns (password, min-entropy).
+
+    Without a word count, the fewest words reaching TARGET_BITS are used.
+    """
+    model = load_model()
+    if words is None:
+        words = model.words_for_entropy(TARGET_BITS)
+    password = model.generate(words)
+    session_passwords.append(password)
+    return password, model.min_entropy(words)
+
+def check_strength(password, entropy=None):
+    """Entropy-based password strength checker.
+
+    Pass the generator's exact entropy when known (min-entropy for
+    pronounceable passwords, since attackers try likely strings first);
+    otherwise it is estimated from the character pool size.
+    """
+    if entropy is not None:
+        return strength_label(entropy)
+
     pool = 0
     if any(c.islower() for c in password):
         pool += 26
@@ -61,7 +82,9 @@ def check_strength(password):
         pool += 30
 
     entropy = math.log2(pool ** len(password)) if pool else 0
+    return strength_label(entropy)
 
+def strength_label(entropy):
     if entropy < 40:
         return Fore.RED + "Weak 🔴"
     elif entropy < 60:
@@ -92,7 +115,7 @@ def banner():
 
 def main_menu():
     print(Fore.YELLOW + "============== Main Menu ================")
-    print(Fore.GREEN + "[1] Generate by Preset (easy/medium/strong/very strong)")
+    print(Fore.GREEN + "[1] Generate by Preset (easy/medium/strong/very strong/pronounceable)")
     print(Fore.GREEN + "[2] Custom Generation (full control)")
     print(Fore.GREEN + "[3] Bulk Quick Generate")
     print(Fore.GREEN + "[4] Copy Last Password to Clipboard")
@@ -104,14 +127,21 @@ def main_menu():
 
 # ---------------- Menu Actions ---------------- #
 def generate_preset():
-    print("\nChoose Strength: easy / medium / strong / very strong")
+    print("\nChoose Strength: easy / medium / strong / very strong / pronounceable")
     strength = input("Strength ➤ ").lower()
-    length = input("Length ➤ ")
-    if not length.isdigit(): length = "12"
+    length = input("Words ➤ " if strength == 'pronounceable' else "Length ➤ ")
     loading_animation("Generating password")
-    pwd = generate_password(int(length), strength)
+    if strength == 'pronounceable':
+        try:
+            pwd, entropy = generate_pronounceable(int(length) if length.isdigit() else None)
+        except (RuntimeError, ValueError) as ex:
+            typing_effect(Fore.RED + f"❌ {ex}\n", delay=0.01)
+            return
+    else:
+        if not length.isdigit(): length = "12"
+        pwd, entropy = generate_password(int(length), strength), None
     typing_effect(Fore.MAGENTA + f"\nGenerated Password: {pwd}\n")
-    print(Fore.CYAN + "Strength ➤ " + check_strength(pwd) + "\n")
+    print(Fore.CYAN + "Strength ➤ " + check_strength(pwd, entropy) + "\n")
 
 def generate_custom():
     chars = input("Enter custom characters to use ➤ ")
@@ -125,16 +155,27 @@ def generate_custom():
 
 def bulk_generate():
     count = input("Number of passwords ➤ ")
-    length = input("Length ➤ ")
     if not count.isdigit(): count = "5"
-    if not length.isdigit(): length = "12"
-    strength = input("Strength (easy/medium/strong/very strong) ➤ ").lower()
+    strength = input("Strength (easy/medium/strong/very strong/pronounceable) ➤ ").lower()
+    length = input("Words ➤ " if strength == 'pronounceable' else "Length ➤ ")
     print()
-    for i in range(int(count)):
+    if strength == 'pronounceable':
+        try:
+            model = load_model()
+            words = int(length) if length.isdigit() else model.words_for_entropy(TARGET_BITS)
+            entropy = model.min_entropy(words)
+            batch = [(pwd, entropy) for pwd in model.generate_batch(int(count), words)]
+        except (RuntimeError, ValueError) as ex:
+            typing_effect(Fore.RED + f"❌ {ex}\n", delay=0.01)
+            return
+        session_passwords.extend(pwd for pwd, _ in batch)
+    else:
+        if not length.isdigit(): length = "12"
+        batch = [(generate_password(int(length), strength), None) for _ in range(int(count))]
+    for i, (pwd, entropy) in enumerate(batch):
         loading_animation(f"Generating password {i+1}")
-        pwd = generate_password(int(length), strength)
         typing_effect(Fore.MAGENTA + pwd, delay=0.01)
-        print(Fore.CYAN + "Strength ➤ " + check_strength(pwd) + "\n")
+        print(Fore.CYAN + "Strength ➤ " + check_strength(pwd, entropy) + "\n")
 
 def copy_last():
     if session_passwords:
@@ -160,6 +201,8 @@ Advanced Password & Security Tool
 
 Features:
 - Preset / Custom / Bulk password generation
+- Pronounceable passwords (Markov-model words joined by digits),
+  rated by the model's exact min-entropy
 - Clipboard copy
 - Session management
 - Save passwords to file
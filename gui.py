@@ -9,6 +9,7 @@ License: MIT
 
 Features:
 - Easy/Medium/Strong/Very Strong modes
+- Pronounceable mode (Markov model trained from wordlist.txt)
 - Custom length + include/exclude: UPPER/lower/digits/symbols
 - Generate multiple passwords at once
 - Scrollable list with per-password Copy button
@@ -28,6 +29,7 @@ import csv
 import random
 import string
 import pyperclip
+from markov import load_model, TARGET_BITS
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
@@ -74,7 +76,13 @@ def generate_password(length, use_upper, use_lower, use_digits, use_symbols):
     return "".join(parts)
 
 def generate_by_mode(mode, count):
-    """Modes: Easy/Medium/Strong/Very Strong (preconfigured flags+length)"""
+    """Modes: Easy/Medium/Strong/Very Strong (preconfigured flags+length), Pronounceable.
+
+    Pronounceable passwords take as many words as the shared entropy target needs.
+    """
+    if mode == "Pronounceable":
+        model = load_model()
+        return model.generate_batch(count, model.words_for_entropy(TARGET_BITS))
     presets = {
         "Easy":        {"length": 10, "upper": True,  "lower": True,  "digits": True,  "symbols": False},
         "Medium":      {"length": 12, "upper": True,  "lower": True,  "digits": True,  "symbols": True},
@@ -161,7 +169,7 @@ class PassForgeGUI(tk.Tk):
         ttk.Label(mode_row, text="Mode:").pack(side="left")
         self.mode_var = tk.StringVar(value="Strong")
         cb = ttk.Combobox(mode_row, textvariable=self.mode_var,
-                          values=["Easy", "Medium", "Strong", "Very Strong"], width=14, state="readonly")
+                          values=["Easy", "Medium", "Strong", "Very Strong", "Pronounceable"], width=14, state="readonly")
         cb.pack(side="left", padx=6)
 
         cnt_row = ttk.Frame(left)
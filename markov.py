@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CipherForge Markov – Pronounceable password generator
+Author: netR4ptOr@  (GitHub: networkblackhat569-jpg)
+License: MIT
+
+An n-gram character model is trained from a wordlist and compiled into a
+compact binary table. Every context row holds a Walker alias table, so each
+character costs one column pick and one threshold compare. The table is
+loaded lazily through mmap and shared by the CLI and the GUI.
+
+Symbol 0 marks both the start and the end of a word, so the model learns
+where words stop. A password is a few generated pseudo-words of at most
+MAX_WORD_LETTERS letters joined by random digits, e.g.
+"pollare7bister3ganter", which reads aloud in chunks.
+
+Strength is a fixed figure per word count, not per sample. The probabilities
+are recovered exactly from the alias tables on load and give two measures:
+- Shannon entropy, the average surprise of a password;
+- min-entropy, -log2 of the most likely password. An attacker guesses the
+  likeliest strings first, so this is the figure the strength label uses.
+Both include log2(10) bits for every digit join.
+
+Usage:
+    python markov.py wordlist.txt markov.cfm [order]
+"""
+
+import os
+import sys
+import math
+import mmap
+import string
+import struct
+import secrets
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORDLIST = os.path.join(HERE, "wordlist.txt")
+
+def _cache_dir():
+    base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    return os.path.join(base or os.path.join(os.path.expanduser("~"), ".cache"), "cipherforge")
+
+DEFAULT_TABLE = os.path.join(_cache_dir(), "markov.cfm")
+
+MAGIC = b"CFMK"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sHBBI4x")   # magic, version, order, alphabet size, states
+COLUMN_BITS = 32
+COLUMN = 1 << COLUMN_BITS
+
+SEPARATORS = string.digits
+TARGET_BITS = 60   # min-entropy both front ends aim for ("Strong" in the CLI)
+MAX_WORDS = 32
+MAX_WORD_LETTERS = 10
+
+SYSTEM_RNG = secrets.SystemRandom()
+_model = None
+
+# -----------------------------
+# Training / compiling
+# -----------------------------
+def train(words, order=2):
+    """Count next-symbol transitions for every context of `order` symbols.
+
+    Symbol 0 is the word boundary and 1..K are letters, so a context is a
+    base-(K+1) number and indexes straight into the table. Rows have K+1
+    entries: ending the word, then each letter.
+    """
+    words = [w.strip().lower() for w in words]
+    words = [w for w in words if w.isalpha() and w.isascii()]
+    if not words:
+        raise ValueError("Wordlist has no usable words.")
+    if not 1 <= order <= 4:
+        raise ValueError("Order must be between 1 and 4.")
+
+    alphabet = "".join(sorted(set("".join(words))))
+    index = {c: i + 1 for i, c in enumerate(alphabet)}
+    radix = len(alphabet) + 1
+    states = radix ** order
+
+    counts = [[0] * radix for _ in range(states)]
+    for word in words:
+        state = 0
+        for c in word:
+            sym = index[c]
+            counts[state][sym] += 1
+            state = (state * radix + sym) % states
+        counts[state][0] += 1
+    return alphabet, order, counts
+
+def _backoff(counts, radix, order):
+    """Fill unseen contexts with counts from the longest seen suffix."""
+    width = len(counts[0])
+    rows = list(counts)
+    for keep in range(order - 1, -1, -1):
+        span = radix ** keep
+        merged = {}
+        for state, row in enumerate(counts):
+            acc = merged.setdefault(state % span, [0] * width)
+            for i, n in enumerate(row):
+                acc[i] += n
+        for state, row in enumerate(rows):
+            if not any(row):
+                rows[state] = merged[state % span]
+    return rows
+
+def build_alias(weights):
+    """Walker alias table for integer weights.
+
+    Returns (thresholds, aliases, units): column i yields symbol i when a
+    32-bit draw is below thresholds[i], otherwise aliases[i]. units[i] is
+    the exact share of symbol i out of K * 2**32.
+    """
+    k = len(weights)
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("Alias table needs at least one positive weight.")
+
+    target = k * COLUMN
+    units = [w * target // total for w in weights]
+    units[weights.index(max(weights))] += target - sum(units)
+
+    thresholds = [COLUMN] * k
+    aliases = list(range(k))
+    left = list(units)
+    small = [i for i in range(k) if left[i] < COLUMN]
+    large = [i for i in range(k) if left[i] >= COLUMN]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        thresholds[s] = left[s]
+        aliases[s] = l
+        left[l] -= COLUMN - left[s]
+        (small if left[l] < COLUMN else large).append(l)
+    # Leftovers hold exactly one full column each
+    for i in small + large:
+        thresholds[i] = COLUMN
+        aliases[i] = i
+    return thresholds, aliases, units
+
+def compile_model(words, path, order=2):
+    """Train from `words` and write the binary table to `path`."""
+    alphabet, order, counts = train(words, order)
+    k = len(alphabet)
+    states = len(counts)
+    rows = _backoff(counts, k + 1, order)
+
+    thresholds, aliases = [], []
+    for row in rows:
+        thr, ali, _ = build_alias(row)
+        # A full column always yields its own symbol, so cap it to fit uint32
+        thresholds += [min(t, COLUMN - 1) for t in thr]
+        aliases += ali
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, order, k, states))
+        f.write(alphabet.encode("ascii"))
+        f.write(struct.pack(f"<{len(thresholds)}I", *thresholds))
+        f.write(bytes(aliases))
+    os.replace(tmp, path)
+    return path
+
+# -----------------------------
+# Runtime model
+# -----------------------------
+class MarkovModel:
+    """Read-only view over a compiled table mapped into memory."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"Truncated Markov table: {path}")
+        magic, version, order, k, states = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"Not a CipherForge Markov table: {path}")
+
+        self.order = order
+        self.states = states
+        self.k = k
+        self.radix = self.width = k + 1
+        off = HEADER.size
+        self.alphabet = self._map[off:off + k].decode("ascii")
+        off += k
+        self._thr_off = off
+        off += states * self.width * 4
+        self._alias_off = off
+
+        expected = off + states * self.width
+        if len(self._map) != expected:
+            self._map.close()
+            raise ValueError(f"Truncated Markov table: {path}")
+
+        self.word_bits, self.word_min_bits = self._word_stats(self._row_probs())
+
+    def _row_probs(self):
+        """Exact (symbol, probability) pairs per row, read back from the alias tables."""
+        n = self.states * self.width
+        thresholds = struct.unpack_from(f"<{n}I", self._map, self._thr_off)
+        aliases = self._map[self._alias_off:self._alias_off + n]
+        total = self.width * COLUMN
+        rows = []
+        for base in range(0, n, self.width):
+            mass = [0] * self.width
+            for i in range(self.width):
+                thr = thresholds[base + i]
+                mass[i] += thr
+                mass[aliases[base + i]] += COLUMN - thr
+            rows.append([(sym, m / total) for sym, m in enumerate(mass) if m])
+        return rows
+
+    def _word_stats(self, rows):
+        """Shannon and min-entropy of one word of at most MAX_WORD_LETTERS letters.
+
+        A single forward pass carries, per state, the probability mass of
+        the prefixes reaching it, their mass-weighted surprisal and the
+        cost -log2 p of the likeliest one. Longer words are rejected when
+        sampling, so both figures are for the distribution renormalised by
+        the mass z of words that fit.
+        """
+        z = surprisal = 0.0
+        best = math.inf
+        dist = {0: (1.0, 0.0, 0.0)}
+        for letters in range(MAX_WORD_LETTERS + 1):
+            nxt = {}
+            for state, (mass, surp, cost) in dist.items():
+                for sym, p in rows[state]:
+                    bits = -math.log2(p)
+                    m = mass * p
+                    e = surp * p + m * bits
+                    if not sym:
+                        z += m
+                        surprisal += e
+                        best = min(best, cost + bits)
+                    elif letters < MAX_WORD_LETTERS:
+                        to = (state * self.radix + sym) % self.states
+                        pm, pe, pc = nxt.get(to, (0.0, 0.0, math.inf))
+                        nxt[to] = (pm + m, pe + e, min(pc, cost + bits))
+            dist = nxt
+        if not z:
+            raise ValueError(f"Model makes no words of {MAX_WORD_LETTERS} letters or fewer.")
+        return surprisal / z + math.log2(z), best + math.log2(z)
+
+    def _step(self, state, rng):
+        """Draw the next symbol from the alias table of `state`."""
+        cell = state * self.width + rng.randrange(self.width)
+        (thr,) = struct.unpack_from("<I", self._map, self._thr_off + cell * 4)
+        if rng.getrandbits(COLUMN_BITS) < thr:
+            return cell - state * self.width
+        return self._map[self._alias_off + cell]
+
+    def generate_word(self, rng=SYSTEM_RNG):
+        """Return one pseudo-word, sampled until the model ends it.
+
+        Words longer than MAX_WORD_LETTERS are thrown away and redrawn.
+        """
+        out = []
+        state = 0
+        while True:
+            sym = self._step(state, rng)
+            if not sym:
+                return "".join(out)
+            if len(out) == MAX_WORD_LETTERS:
+                out = []
+                state = 0
+                continue
+            out.append(self.alphabet[sym - 1])
+            state = (state * self.radix + sym) % self.states
+
+    def generate(self, words=4, rng=SYSTEM_RNG):
+        """Return one password of `words` pseudo-words joined by random digits."""
+        if words < 1:
+            raise ValueError("Need at least one word.")
+        parts = [self.generate_word(rng)]
+        for _ in range(words - 1):
+            parts.append(rng.choice(SEPARATORS))
+            parts.append(self.generate_word(rng))
+        return "".join(parts)
+
+    def generate_batch(self, count, words=4, rng=SYSTEM_RNG):
+        """Return a list of `count` pronounceable passwords."""
+        return [self.generate(words, rng) for _ in range(count)]
+
+    def entropy(self, words):
+        """Shannon entropy in bits of a `words`-word password, joins included."""
+        return words * self.word_bits + (words - 1) * math.log2(len(SEPARATORS))
+
+    def min_entropy(self, words):
+        """Min-entropy in bits of a `words`-word password, joins included."""
+        return words * self.word_min_bits + (words - 1) * math.log2(len(SEPARATORS))
+
+    def words_for_entropy(self, bits=TARGET_BITS):
+        """Smallest word count whose min-entropy reaches `bits`."""
+        for words in range(1, MAX_WORDS + 1):
+            if self.min_entropy(words) >= bits:
+                return words
+        raise ValueError(f"Model cannot reach {bits:.0f} bits within {MAX_WORDS} words.")
+
+    def close(self):
+        self._map.close()
+
+def _stale(path, wordlist):
+    return (
+        not os.path.exists(path)
+        or (os.path.exists(wordlist) and os.path.getmtime(wordlist) > os.path.getmtime(path))
+    )
+
+def _compile_file(wordlist, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(wordlist, encoding="utf-8") as f:
+        compile_model(f.read().split(), path)
+
+def _open_or_build(path, wordlist):
+    if not _stale(path, wordlist):
+        try:
+            return MarkovModel(path)
+        except ValueError:
+            pass  # older format or a broken write: rebuild below
+    try:
+        _compile_file(wordlist, path)
+    except OSError:
+        # Read-only install or a table held open elsewhere: keep the one we have
+        if os.path.exists(path):
+            return MarkovModel(path)
+        raise
+    return MarkovModel(path)
+
+def load_model(path=None, wordlist=None):
+    """Return the shared model, compiling the table on first use.
+
+    The default table lives in the user cache directory. It is rebuilt when
+    missing, older than the wordlist or unreadable; if the rebuild cannot be
+    written, an existing valid table is used. Any failure is raised as a
+    RuntimeError. Only the default model is cached.
+    """
+    global _model
+    is_default = path is None and wordlist is None
+    if is_default and _model is not None:
+        return _model
+
+    try:
+        model = _open_or_build(path or DEFAULT_TABLE, wordlist or DEFAULT_WORDLIST)
+    except (OSError, ValueError) as ex:
+        raise RuntimeError(f"Pronounceable model unavailable: {ex}") from ex
+
+    if is_default:
+        _model = model
+    return model
+
+def main(argv):
+    if len(argv) < 3:
+        print(__doc__.strip().splitlines()[-1].strip())
+        return 1
+    order = int(argv[3]) if len(argv) > 3 else 2
+    with open(argv[1], encoding="utf-8") as f:
+        compile_model(f.read().split(), argv[2], order)
+    print(f"Compiled {argv[1]} -> {argv[2]} (order {order})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
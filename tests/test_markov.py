@@ -0,0 +1,218 @@
+import math
+import os
+import random
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import markov
+from markov import COLUMN, HEADER, MarkovModel, build_alias, compile_model, load_model
+
+
+def table_size(k, states):
+    return HEADER.size + k + states * (k + 1) * (4 + 1)
+
+
+def h(*probs):
+    return -sum(p * math.log2(p) for p in probs)
+
+
+@pytest.fixture
+def tiny(tmp_path):
+    # order 1, symbols: 0 end, 1 a, 2 b
+    # start: a 2/3, b 1/3 | after a: end 1/2, a 1/4, b 1/4 | after b: end 1/2, a 1/2
+    path = str(tmp_path / "tiny.cfm")
+    compile_model(["ab", "aa", "ba"], path, order=1)
+    return path
+
+
+@pytest.mark.parametrize("weights", [
+    [5, 0, 3, 1, 1],
+    [1],
+    [0, 0, 7],
+    [1, 1, 1, 1],
+    [random.Random(seed).randrange(0, 1000) + 1 for seed in range(26)],
+])
+def test_build_alias_reproduces_units(weights):
+    thresholds, aliases, units = build_alias(weights)
+    k = len(weights)
+    assert sum(units) == k * COLUMN
+
+    mass = [0] * k
+    for i in range(k):
+        mass[i] += thresholds[i]
+        mass[aliases[i]] += COLUMN - thresholds[i]
+    assert mass == units
+    assert all(u == 0 for u, w in zip(units, weights) if w == 0)
+
+
+def test_build_alias_rejects_empty_weights():
+    with pytest.raises(ValueError):
+        build_alias([0, 0])
+
+
+def test_train_counts_word_ends():
+    alphabet, order, counts = markov.train(["ab", "aa", "ba"], order=1)
+    assert alphabet == "ab"
+    assert counts == [[0, 2, 1], [2, 1, 1], [1, 1, 0]]
+
+
+def test_compile_round_trip(tiny):
+    with open(tiny, "rb") as f:
+        data = f.read()
+    magic, version, order, k, states = HEADER.unpack_from(data, 0)
+    assert (magic, version, order, k, states) == (markov.MAGIC, markov.FORMAT_VERSION, 1, 2, 3)
+    assert data[HEADER.size:HEADER.size + k] == b"ab"
+    assert len(data) == table_size(k, states)
+
+    model = MarkovModel(tiny)
+    assert model.alphabet == "ab"
+    rows = model._row_probs()
+    want = [
+        [(1, 2 / 3), (2, 1 / 3)],
+        [(0, 1 / 2), (1, 1 / 4), (2, 1 / 4)],
+        [(0, 1 / 2), (1, 1 / 2)],
+    ]
+    assert [[sym for sym, _ in row] for row in rows] == [[sym for sym, _ in row] for row in want]
+    for row, want_row in zip(rows, want):
+        assert [p for _, p in row] == pytest.approx([p for _, p in want_row], abs=1e-9)
+
+    rng = random.Random(1)
+    words = [model.generate_word(rng) for _ in range(6000)]
+    assert all(w and "bb" not in w and len(w) <= markov.MAX_WORD_LETTERS for w in words)
+    freq = Counter(words)
+    assert abs(freq["a"] / len(words) - 1 / 3) < 0.03
+    assert abs(freq["b"] / len(words) - 1 / 6) < 0.03
+    model.close()
+
+
+def test_generate_joins_words_with_digits(tiny):
+    model = MarkovModel(tiny)
+    pwd = model.generate(4, random.Random(3))
+    chunks = "".join(ch if ch.isalpha() else " " for ch in pwd).split()
+    assert len(chunks) == 4
+    assert sum(ch.isdigit() for ch in pwd) == 3
+    with pytest.raises(ValueError):
+        model.generate(0)
+    model.close()
+
+
+def test_backoff_uses_longest_seen_suffix():
+    alphabet, order, counts = markov.train(["ab", "ba"], order=2)
+    radix = len(alphabet) + 1
+    rows = markov._backoff(counts, radix, order)
+    aa = 1 * radix + 1
+    bb = 2 * radix + 2
+    assert not any(counts[aa]) and not any(counts[bb])
+    # Suffix "a" is followed by b (in "ab") and by the end (in "ba")
+    assert rows[aa] == [1, 0, 1]
+    # Suffix "b" is followed by a (in "ba") and by the end (in "ab")
+    assert rows[bb] == [1, 1, 0]
+    # Seen contexts keep their own counts
+    assert rows[0] == counts[0]
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "bad.cfm"
+    path.write_bytes(b"NOPE" + bytes(64))
+    with pytest.raises(ValueError, match="Not a CipherForge"):
+        MarkovModel(str(path))
+
+
+def test_truncated_table(tiny, tmp_path):
+    with open(tiny, "rb") as f:
+        data = f.read()
+
+    short = tmp_path / "short.cfm"
+    short.write_bytes(data[:-1])
+    with pytest.raises(ValueError, match="Truncated"):
+        MarkovModel(str(short))
+
+    stub = tmp_path / "stub.cfm"
+    stub.write_bytes(data[:6])
+    with pytest.raises(ValueError, match="Truncated"):
+        MarkovModel(str(stub))
+
+
+def test_entropy_order1_by_hand(tiny, monkeypatch):
+    # Long enough cap that the cut-off mass is negligible
+    monkeypatch.setattr(markov, "MAX_WORD_LETTERS", 80)
+    model = MarkovModel(tiny)
+
+    # Expected visits before the word ends: a 4/3, b 2/3
+    word_bits = h(2 / 3, 1 / 3) + 4 / 3 * h(1 / 2, 1 / 4, 1 / 4) + 2 / 3 * h(1 / 2, 1 / 2)
+    assert model.word_bits == pytest.approx(word_bits, abs=1e-9)
+    # The likeliest word is "a": 2/3 * 1/2
+    assert model.word_min_bits == pytest.approx(math.log2(3), abs=1e-9)
+
+    joins = math.log2(10)
+    assert model.entropy(3) == pytest.approx(3 * word_bits + 2 * joins, abs=1e-9)
+    assert model.min_entropy(3) == pytest.approx(3 * math.log2(3) + 2 * joins, abs=1e-9)
+    assert model.words_for_entropy(10) == 3
+    model.close()
+
+
+def test_entropy_with_word_cap(tiny, monkeypatch):
+    # Only "a" (1/3) and "b" (1/6) fit one letter; renormalised they are 2/3 and 1/3
+    monkeypatch.setattr(markov, "MAX_WORD_LETTERS", 1)
+    model = MarkovModel(tiny)
+    assert model.word_bits == pytest.approx(h(2 / 3, 1 / 3), abs=1e-9)
+    assert model.word_min_bits == pytest.approx(math.log2(3 / 2), abs=1e-9)
+
+    rng = random.Random(5)
+    words = Counter(model.generate_word(rng) for _ in range(6000))
+    assert set(words) == {"a", "b"}
+    assert abs(words["a"] / 6000 - 2 / 3) < 0.03
+    model.close()
+
+
+def test_load_model_errors_are_runtime_errors(tmp_path):
+    with pytest.raises(RuntimeError):
+        load_model(str(tmp_path / "m.cfm"), str(tmp_path / "missing.txt"))
+
+
+def test_load_model_rebuilds_unreadable_table(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("ab\nba\n")
+    table = tmp_path / "m.cfm"
+    table.write_bytes(b"junk")
+    os.utime(words, (0, 0))
+
+    model = load_model(str(table), str(words))
+    assert model.alphabet == "ab"
+    model.close()
+
+
+def test_load_model_keeps_stale_table_when_rebuild_fails(tmp_path, monkeypatch):
+    words = tmp_path / "words.txt"
+    words.write_text("ab\nba\n")
+    table = str(tmp_path / "m.cfm")
+    compile_model(["ab", "ba"], table)
+    os.utime(table, (0, 0))
+
+    def read_only(*args):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(markov, "_compile_file", read_only)
+    model = load_model(table, str(words))
+    assert model.alphabet == "ab"
+    model.close()
+
+
+def test_load_model_only_caches_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(markov, "_model", None)
+    monkeypatch.setattr(markov, "DEFAULT_TABLE", str(tmp_path / "cache" / "markov.cfm"))
+    words = tmp_path / "words.txt"
+    words.write_text("ab\nba\n")
+
+    custom = load_model(wordlist=str(words))
+    assert custom.alphabet == "ab"
+    assert markov._model is None
+    custom.close()
+
+
+def test_default_rng_is_system_random():
+    assert isinstance(markov.SYSTEM_RNG, random.SystemRandom)